@@ -1,10 +1,276 @@
 
-from ftplib import FTP, error_perm
+from collections import deque
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from ftplib import FTP, FTP_TLS, all_errors, error_perm, error_temp
 from os.path import join as pjoin
+from queue import Empty, Full, LifoQueue, Queue
+import asyncio
 import os
+import ssl
+import threading
+import time
 import typing
 
 
+# Block size for RETR/STOR; ftplib's 8 KiB default costs a syscall per 8 KiB moved.
+TRANSFER_BLOCKSIZE = 1024 * 1024
+
+# Seconds between NOOPs sent on a control connection while a data transfer runs, or while the main
+# connection waits for transfers on worker connections.
+KEEPALIVE_INTERVAL = 30
+
+# Seconds an idle pooled worker connection is kept before it is closed instead of reused.
+CONNECTION_IDLE_TIMEOUT = 60
+
+# Files at least this large are downloaded as parallel byte ranges by copy_file_to_local_directory.
+PARALLEL_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+
+# Shared by every FTPS connection so TLS sessions can be resumed across connections.
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+def _rebase_path(path: str, old_root: str, new_root: str) -> str:
+	"""
+	Map a path under old_root to the same relative location under new_root.
+
+	Parameters:
+		path (str): A path inside old_root.
+		old_root (str): The root path is relative to.
+		new_root (str): The root to move path under.
+
+	Returns:
+		str: The rebased path.
+
+	"""
+
+	relative_path = os.path.relpath(path, old_root)
+
+	if relative_path == os.curdir:
+		return new_root
+
+	return pjoin(new_root, relative_path)
+
+
+def _parse_mdtm(timestamp: str) -> float:
+	"""
+	Convert an MLSD `modify` fact or MDTM reply (YYYYMMDDHHMMSS[.sss], UTC) to a POSIX timestamp.
+
+	Parameters:
+		timestamp (str): The time value sent by the server.
+
+	Returns:
+		float: Seconds since the epoch.
+
+	"""
+
+	parsed = datetime.strptime(timestamp[:14], '%Y%m%d%H%M%S').replace(tzinfo = timezone.utc)
+	fraction = float('0' + timestamp[14:]) if timestamp[14:] else 0.0
+	return parsed.timestamp() + fraction
+
+
+class _BackgroundWriter:
+	"""
+	Write to a file object from a helper thread.
+
+	Used as the RETR data callback so that reading the data socket is not stalled by disk writes.
+	At most `max_pending` chunks are queued; a write error is raised on the next write or on close.
+	`written` counts the bytes accepted by the file object.
+
+	"""
+
+	def __init__(self, file: typing.BinaryIO, max_pending: int = 8):
+		self._file = file
+		self._pending = Queue(maxsize = max_pending)
+		self._error = None
+		self.written = 0
+		self._thread = threading.Thread(target = self._run, daemon = True)
+		self._thread.start()
+
+	def _run(self):
+		while True:
+			data = self._pending.get()
+			if data is None:
+				return
+			if self._error is None:
+				try:
+					self._file.write(data)
+					self.written += len(data)
+				except Exception as error:
+					self._error = error
+
+	def write(self, data: bytes) -> None:
+		if self._error is not None:
+			raise self._error
+		self._pending.put(data)
+
+	def close(self) -> None:
+		self._pending.put(None)
+		self._thread.join()
+		if self._error is not None:
+			raise self._error
+
+
+class _ControlKeepalive:
+	"""
+	Send NOOP on an FTP control connection every `interval` seconds (KEEPALIVE_INTERVAL when not
+	given) while a data transfer runs.
+
+	Servers and firewalls drop control connections that sit idle through a long transfer. The NOOPs
+	are sent without reading their replies, so stop() must be called before the control connection is
+	read again; finish() then reads the transfer reply together with one reply per NOOP sent.
+
+	"""
+
+	def __init__(self, ftp: FTP, interval: float = None):
+		self._ftp = ftp
+		self._interval = KEEPALIVE_INTERVAL if interval is None else interval
+		self._sent = 0
+		self._stopped = threading.Event()
+		self._thread = threading.Thread(target = self._run, daemon = True)
+		self._thread.start()
+
+	def _run(self):
+		while not self._stopped.wait(self._interval):
+			try:
+				self._ftp.putcmd('NOOP')
+			except OSError:
+				return
+			self._sent += 1
+
+	def stop(self) -> None:
+		self._stopped.set()
+		self._thread.join()
+
+	def finish(self) -> str:
+		"""
+		Read the reply to the transfer and to each NOOP sent, in whatever order the server sent them.
+
+		Servers may answer NOOPs before or after the transfer reply, and some refuse NOOP during a
+		transfer, so only the transfer reply decides whether the transfer failed.
+
+		Returns:
+			str: The server's reply to the transfer.
+
+		"""
+
+		if not self._sent:
+			return self._ftp.voidresp()
+
+		replies = []
+		failure = None
+		for _ in range(1 + self._sent):
+			try:
+				replies.append(self._ftp.getresp())
+			except (error_temp, error_perm) as e:
+				failure = failure or e
+		self._sent = 0
+
+		for reply in replies:
+			if reply[:1] == '2' and reply[:3] != '200': # 200 answers NOOP, 226 or 250 ends a transfer
+				return reply
+		if failure is not None:
+			raise failure
+		return replies[-1]
+
+
+def _retrbinary(ftp: FTP, cmd: str, callback: typing.Callable, blocksize: int = TRANSFER_BLOCKSIZE, rest: int = None) -> str:
+	"""
+	ftplib.FTP.retrbinary, keeping the control connection alive with NOOP while data is received.
+
+	Parameters:
+		ftp (ftplib.FTP): The connection to transfer over.
+		cmd (str): The RETR command.
+		callback (typing.Callable): Called with each block of data received.
+		blocksize (int, optional): The maximum number of bytes to read at a time.
+		rest (int, optional): The byte offset to restart the transfer from.
+
+	Returns:
+		str: The server's reply to the transfer.
+
+	"""
+
+	ftp.voidcmd('TYPE I')
+
+	with ftp.transfercmd(cmd, rest) as conn:
+		keepalive = _ControlKeepalive(ftp)
+		try:
+			while True:
+				data = conn.recv(blocksize)
+				if not data:
+					break
+				callback(data)
+			if isinstance(conn, ssl.SSLSocket):
+				conn.unwrap()
+		finally:
+			keepalive.stop()
+
+	return keepalive.finish()
+
+
+def _storbinary(ftp: FTP, cmd: str, fp: typing.BinaryIO, blocksize: int = TRANSFER_BLOCKSIZE, rest: int = None) -> str:
+	"""
+	ftplib.FTP.storbinary, keeping the control connection alive with NOOP while data is sent.
+
+	Parameters:
+		ftp (ftplib.FTP): The connection to transfer over.
+		cmd (str): The STOR or APPE command.
+		fp (typing.BinaryIO): The file object to read from.
+		blocksize (int, optional): The maximum number of bytes to send at a time.
+		rest (int, optional): The byte offset to restart the transfer from.
+
+	Returns:
+		str: The server's reply to the transfer.
+
+	"""
+
+	ftp.voidcmd('TYPE I')
+
+	with ftp.transfercmd(cmd, rest) as conn:
+		keepalive = _ControlKeepalive(ftp)
+		try:
+			while True:
+				buf = fp.read(blocksize)
+				if not buf:
+					break
+				conn.sendall(buf)
+			if isinstance(conn, ssl.SSLSocket):
+				conn.unwrap()
+		finally:
+			keepalive.stop()
+
+	return keepalive.finish()
+
+
+class _SessionReusingFTP_TLS(FTP_TLS):
+	"""
+	An FTP_TLS connection that resumes a TLS session on its control and data channels.
+
+	The control channel resumes `session` when one is given, and every data channel resumes the
+	control channel's session. This avoids a full handshake per connection and satisfies servers
+	that require TLS session reuse on data channels (vsftpd `require_ssl_reuse`, ProFTPD).
+
+	"""
+
+	def __init__(self, *args, session: ssl.SSLSession = None, **kwargs):
+		self._session = session
+		super().__init__(*args, **kwargs)
+
+	def auth(self):
+		if isinstance(self.sock, ssl.SSLSocket):
+			raise ValueError('Already using TLS')
+		resp = self.voidcmd('AUTH TLS')
+		self.sock = self.context.wrap_socket(self.sock, server_hostname = self.host, session = self._session)
+		self.file = self.sock.makefile(mode = 'r', encoding = self.encoding)
+		return resp
+
+	def ntransfercmd(self, cmd, rest = None):
+		conn, size = FTP.ntransfercmd(self, cmd, rest)
+		if self._prot_p:
+			conn = self.context.wrap_socket(conn, server_hostname = self.host, session = self.sock.session)
+		return conn, size
+
+
 class FTPDataExchange:
 	"""
 	A class for managing file transfers and operations on Box using FTP.
@@ -18,9 +284,13 @@ class FTPDataExchange:
 		user (str): The FTP username for authentication.
 		password (str): The FTP password for authentication.
 		ftp (ftplib.FTP): The FTP connection object.
+		max_connections (int): The maximum number of worker connections opened for concurrent transfers.
+		use_tls (bool): Whether to connect with explicit FTPS (FTP over TLS).
+		ssl_context (ssl.SSLContext): The SSL context used by every FTPS connection.
 
 	Methods:
-		__init__(self, ftp_host: str, ftp_user: str, ftp_passwd: str):
+		__init__(self, ftp_host: str, ftp_user: str, ftp_passwd: str, max_connections: int = 8, use_tls: bool = False,
+				 ssl_context: ssl.SSLContext = None):
 			Initialize a BoxDataManager instance and connect to Box via FTP.
 
 		connect_to_box(self):
@@ -30,28 +300,44 @@ class FTPDataExchange:
 			List files in the specified remote directory on Box via FTP.
 
 		walk_remote_tree(self, remote_root_directory: str) -> typing.Generator:
-			Traverse the remote directory tree using breadth-first search and yield each directory path.
+			Traverse the remote directory tree using breadth-first search and yield each directory path with its listing.
 
 		recursively_copy_files_from_remote_directory(self, local_root_directory: str, remote_root_directory: str,
 													 overwrite_local_file: bool = False, verbose: bool = False,
-													 dry_run: bool = False, filetype_restrictions: list = []) -> None:
+													 dry_run: bool = False, filetype_restrictions: tuple = (),
+													 concurrency: int = 1, resume_partial_files: bool = False) -> None:
 			Recursively copy files from a remote directory to a local directory using FTP.
 
+		async_recursively_copy_files_from_remote_directory(self, local_root_directory: str, remote_root_directory: str,
+														   overwrite_local_file: bool = False, verbose: bool = False,
+														   dry_run: bool = False, filetype_restrictions: tuple = (),
+														   concurrency: int = 4) -> None:
+			Recursively copy files from a remote directory to a local directory using asyncio and aioftp.
+
 		walk_local_tree(self, local_root_directory: str):
-			Traverse the local directory tree using breadth-first search and yield each directory path.
+			Traverse the local directory tree using breadth-first search and yield each directory path with its entries.
 
 		recursively_copy_files_from_local_directory(self, remote_root_directory: str, local_root_directory: str,
 													 overwrite_remote_file: bool = False, verbose: bool = False,
-													 dry_run: bool = False, filetype_restrictions: list = []) -> None:
+													 dry_run: bool = False, filetype_restrictions: tuple = (),
+													 concurrency: int = 1, sync_mode: bool = False,
+													 resume_partial_files: bool = False) -> None:
 			Recursively copy files from a local directory to a remote directory using FTP.
 
 		copy_file_to_remote_directory(self, local_file_path: str, target_remote_directory: str) -> None:
 			Copy a file from local directory to a remote directory using FTP.
 
+		copy_file_to_local_directory(self, remote_file_path: str, target_local_directory: str, concurrency: int = 1) -> None:
+			Copy a file from a remote directory to a local directory using FTP.
+
+		close(self) -> None:
+			Close the main connection and every idle pooled worker connection.
+
 
 	"""
 
-	def __init__(self, ftp_host : str, ftp_user : str, ftp_passwd : str):
+	def __init__(self, ftp_host : str, ftp_user : str, ftp_passwd : str, max_connections : int = 8, use_tls : bool = False,
+				 ssl_context : ssl.SSLContext = None):
 		"""
 		Initialize a BoxDataManager instance and connect to Box via FTP.
 
@@ -59,12 +345,23 @@ class FTPDataExchange:
 			ftp_host (str): The FTP host for the Box account.
 			ftp_user (str): The FTP username for authentication.
 			ftp_passwd (str): The FTP password for authentication.
+			max_connections (int, optional): The maximum number of worker connections opened for concurrent transfers. Default is 8.
+				Idle worker connections are pooled and reused by later calls.
+			use_tls (bool, optional): Whether to connect with explicit FTPS (FTP over TLS). Default is False.
+			ssl_context (ssl.SSLContext, optional): The SSL context for FTPS connections, e.g. one trusting a private CA.
+				Default is a shared context from ssl.create_default_context().
 
 		"""
 
 		self.host = ftp_host
 		self.user = ftp_user
 		self.password = ftp_passwd
+		self.max_connections = max_connections
+		self.use_tls = use_tls
+		self.ssl_context = ssl_context if ssl_context is not None else _SSL_CONTEXT
+		self._tls_session = None
+		self._connection_slots = threading.BoundedSemaphore(max_connections)
+		self._idle_connections = LifoQueue(maxsize = max_connections)
 		self.connect_to_remote()
 
 	def connect_to_remote(self):
@@ -77,13 +374,329 @@ class FTPDataExchange:
 		"""
 
 		try: 
-			self.ftp = FTP(self.host)
-			self.ftp.login(user = self.user, passwd = self.password)
-			self.ftp.set_pasv(True)
+			self.ftp = self._new_connection()
 
 		except Exception as error:
 			raise Exception(error)
 
+	def _new_connection(self) -> FTP:
+		"""
+		Open and log in a new FTP connection using the stored credentials.
+
+		With use_tls, the TLS session of the first connection is cached and resumed by every later
+		connection, so only the first one pays for a full handshake.
+
+		Returns:
+			ftplib.FTP: A logged in FTP connection in passive mode.
+
+		"""
+
+		if self.use_tls:
+			ftp = _SessionReusingFTP_TLS(self.host, context = self.ssl_context, session = self._tls_session)
+			ftp.login(user = self.user, passwd = self.password)
+			ftp.prot_p()
+			if self._tls_session is None:
+				self._tls_session = ftp.sock.session
+		else:
+			ftp = FTP(self.host)
+			ftp.login(user = self.user, passwd = self.password)
+
+		ftp.set_pasv(True)
+		return ftp
+
+	@staticmethod
+	def _quit(ftp: FTP) -> None:
+		"""
+		Close a connection, politely if the server still answers.
+
+		Parameters:
+			ftp (ftplib.FTP): The connection to close.
+
+		"""
+
+		try:
+			ftp.quit()
+		except Exception:
+			ftp.close()
+
+	def _open_worker_connection(self) -> FTP:
+		"""
+		Check out a connection for a transfer worker, blocking while max_connections are checked out.
+
+		The most recently released idle connection is reused if it is younger than
+		CONNECTION_IDLE_TIMEOUT and still answers NOOP; otherwise a new connection is opened.
+
+		Returns:
+			ftplib.FTP: A logged in FTP connection owned by the calling worker.
+
+		"""
+
+		self._connection_slots.acquire()
+
+		try:
+			while True:
+				try:
+					ftp, released_at = self._idle_connections.get_nowait()
+				except Empty:
+					break
+
+				if time.monotonic() - released_at < CONNECTION_IDLE_TIMEOUT:
+					try:
+						ftp.voidcmd('NOOP')
+						return ftp
+					except Exception:
+						pass
+
+				self._quit(ftp)
+
+			return self._new_connection()
+
+		except Exception:
+			self._connection_slots.release()
+			raise
+
+	def _release_worker_connection(self, ftp: FTP, reusable: bool = True) -> None:
+		"""
+		Return a connection checked out by _open_worker_connection to the idle pool and free its slot.
+
+		Parameters:
+			ftp (ftplib.FTP): The worker connection to release.
+			reusable (bool, optional): False closes the connection instead, e.g. after a failed transfer
+				that may have left replies unread on the control channel.
+
+		"""
+
+		try:
+			if not reusable:
+				self._quit(ftp)
+				return
+
+			try:
+				self._idle_connections.put_nowait((ftp, time.monotonic()))
+			except Full:
+				self._quit(ftp)
+
+		finally:
+			self._connection_slots.release()
+
+	def close(self) -> None:
+		"""
+		Close the main connection and every idle pooled worker connection.
+
+		Returns:
+			None
+
+		"""
+
+		while True:
+			try:
+				ftp, _ = self._idle_connections.get_nowait()
+			except Empty:
+				break
+			self._quit(ftp)
+
+		self._quit(self.ftp)
+
+	def _run_transfers(self, transfer: typing.Callable, jobs: list, concurrency: int = 1) -> None:
+		"""
+		Run file transfers either serially on the main connection or on a thread pool.
+
+		Each worker thread owns its own FTP connection; the main connection is never shared across
+		threads because interleaved commands on one control socket corrupt transfers.
+
+		Parameters:
+			transfer (typing.Callable): Called as transfer(ftp, *job) for each job.
+			jobs (list): Argument tuples, one per file to transfer.
+			concurrency (int): The number of worker threads. 1 transfers serially on self.ftp.
+
+		Returns:
+			None
+
+		"""
+
+		if concurrency <= 1 or len(jobs) <= 1:
+			for job in jobs:
+				transfer(self.ftp, *job)
+			return
+
+		thread_state = threading.local()
+		opened_connections = []
+		opened_lock = threading.Lock()
+
+		def worker(job):
+			ftp = getattr(thread_state, 'ftp', None)
+
+			if ftp is None:
+				ftp = self._open_worker_connection()
+				thread_state.ftp = ftp
+				with opened_lock:
+					opened_connections.append(ftp)
+
+			try:
+				transfer(ftp, *job)
+			except Exception:
+				# a failed transfer can leave replies unread on the control channel, so the thread's
+				# next job must not reuse this connection
+				thread_state.ftp = None
+				with opened_lock:
+					opened_connections.remove(ftp)
+				self._release_worker_connection(ftp, reusable = False)
+				raise
+
+		try:
+			with ThreadPoolExecutor(max_workers = min(concurrency, self.max_connections, len(jobs))) as executor:
+				self._wait_for_transfers([executor.submit(worker, job) for job in jobs])
+		finally:
+			for ftp in opened_connections:
+				self._release_worker_connection(ftp)
+
+	def _wait_for_transfers(self, futures: list) -> None:
+		"""
+		Wait for submitted transfers, cancelling the ones not yet started as soon as one fails.
+
+		The transfers run on worker connections, so the main connection is sent a NOOP every
+		KEEPALIVE_INTERVAL seconds to keep it from timing out while it waits.
+
+		Parameters:
+			futures (list): The futures of the submitted transfers.
+
+		Returns:
+			None
+
+		Raises:
+			Exception: The error of the first transfer that failed.
+
+		"""
+
+		while True:
+			done, not_done = wait(futures, timeout = KEEPALIVE_INTERVAL, return_when = FIRST_EXCEPTION)
+
+			for future in done:
+				if future.exception() is not None:
+					for pending in not_done:
+						pending.cancel()
+					raise future.exception()
+
+			if not not_done:
+				return
+
+			try:
+				self.ftp.voidcmd('NOOP')
+			except all_errors: # a dropped main connection surfaces on its next real command
+				pass
+
+	@staticmethod
+	def _remote_file_is_current(local_entry: os.DirEntry, remote_facts: typing.Optional[dict]) -> bool:
+		"""
+		Check whether a remote file has the same size as a local file and is no older than it.
+
+		Parameters:
+			local_entry (os.DirEntry): The local file.
+			remote_facts (dict, optional): The MLSD facts of the remote file, or None if it does not exist.
+
+		Returns:
+			bool: True if the remote file does not need to be uploaded again.
+
+		"""
+
+		if not remote_facts or 'size' not in remote_facts or 'modify' not in remote_facts:
+			return False
+
+		local_stat = local_entry.stat()
+
+		# MLSD times are usually whole seconds, so compare against the truncated local mtime
+		return int(remote_facts['size']) == local_stat.st_size and _parse_mdtm(remote_facts['modify']) >= int(local_stat.st_mtime)
+
+	@staticmethod
+	def _download_file(ftp: FTP, remote_file_path: str, local_file_path: str, size: int = 0, offset: int = 0) -> None:
+		"""
+		Download a single remote file to a local path.
+
+		The local file is written through a TRANSFER_BLOCKSIZE buffer on a background thread, so disk
+		writes overlap with reading the socket, and is preallocated when the remote size is known.
+		With an offset, the download resumes with REST from that byte of an existing partial file, or
+		starts again from the first byte if the server rejects REST.
+		The file is truncated to the bytes actually written, so a preallocated file never looks
+		complete after a failed download, and never ends in zeros if the remote file shrank.
+
+		Parameters:
+			ftp (ftplib.FTP): The connection to transfer over.
+			remote_file_path (str): The absolute path of the remote file.
+			local_file_path (str): The path of the local file to write.
+			size (int, optional): The number of bytes to preallocate, 0 to skip preallocation.
+			offset (int, optional): The number of bytes already downloaded to local_file_path.
+
+		Returns:
+			None
+
+		"""
+
+		try:
+			with open(local_file_path, 'r+b' if offset else 'wb', buffering = TRANSFER_BLOCKSIZE) as in_file:
+				in_file.seek(offset)
+
+				if size and hasattr(os, 'posix_fallocate'):
+					try:
+						os.posix_fallocate(in_file.fileno(), 0, size)
+					except OSError: # not supported by every filesystem
+						pass
+
+				writer = _BackgroundWriter(in_file)
+				try:
+					_retrbinary(ftp, 'RETR ' + remote_file_path, writer.write, rest = offset or None)
+					writer.close()
+					in_file.truncate(offset + writer.written)
+				except BaseException:
+					try:
+						writer.close()
+					except Exception:
+						pass
+
+					try:
+						in_file.truncate(offset + writer.written)
+					except OSError: # flushing failed, keep only what was there before this download
+						os.ftruncate(in_file.fileno(), offset)
+					raise
+
+		except error_perm:
+			if not offset or writer.written: # REST was accepted, the transfer itself failed
+				raise
+			# REST is not supported, download the whole file again
+			FTPDataExchange._download_file(ftp, remote_file_path, local_file_path, size)
+
+	@staticmethod
+	def _upload_file(ftp: FTP, local_file_path: str, remote_file_path: str, offset: int = 0) -> None:
+		"""
+		Upload a single local file to a remote path.
+
+		With an offset, the upload resumes from that byte of an existing partial remote file, using
+		REST + STOR where the server supports it and APPE otherwise.
+
+		Parameters:
+			ftp (ftplib.FTP): The connection to transfer over.
+			local_file_path (str): The path of the local file to read.
+			remote_file_path (str): The remote path to store the file at.
+			offset (int, optional): The number of bytes already stored at remote_file_path.
+
+		Returns:
+			None
+
+		"""
+
+		with open(local_file_path, 'rb') as out_file:
+
+			if not offset:
+				_storbinary(ftp, 'STOR ' + remote_file_path, out_file)
+				return
+
+			out_file.seek(offset)
+
+			try:
+				_storbinary(ftp, 'STOR ' + remote_file_path, out_file, rest = offset)
+			except error_perm: # REST before STOR is not supported
+				out_file.seek(offset)
+				_storbinary(ftp, 'APPE ' + remote_file_path, out_file)
+
 	def list_files_remote(self, remote_directory: str = '/') -> list:
 		"""
 		List files in the specified remote directory on Box via FTP.
@@ -100,9 +713,7 @@ class FTPDataExchange:
 		"""
 		
 		try: 
-			self.ftp.cwd(remote_directory)
-			file_list = []
-			self.ftp.retrlines('LIST', lambda x: file_list.append(x.split()[-1]))
+			file_list = [name for name, facts in self.ftp.mlsd(remote_directory) if facts.get('type') not in ('cdir', 'pdir')]
 			return(file_list)
 
 		except Exception as error:
@@ -110,27 +721,26 @@ class FTPDataExchange:
 
 	def walk_remote_tree(self, remote_root_directory: str) -> typing.Generator:
 		"""
-		Traverse the remote directory tree using breadth-first search and yield each directory path.
+		Traverse the remote directory tree using breadth-first search and yield each directory path with its listing.
+
+		Each directory is listed once; the listing is yielded so callers can pick out files without
+		listing the directory again.
 
 		Parameters:
 			remote_root_directory (str, optional): The root directory on the remote FTP server.
 
 		Yields:
-			str: The path of each directory in the remote tree.
+			tuple: The path of each directory in the remote tree and its list of (name, facts) MLSD entries.
 
 		"""
 
-		yield remote_root_directory
-
-		queue = [remote_root_directory]
+		queue = deque([remote_root_directory])
 
 		while queue:
 
-			current_directory = queue.pop(0)	
+			current_directory = queue.popleft()
 
-			self.ftp.cwd(current_directory)
-
-			filelist = [i for i in self.ftp.mlsd()]
+			filelist = [i for i in self.ftp.mlsd(current_directory)]
 
 			for f in filelist:
 
@@ -138,26 +748,27 @@ class FTPDataExchange:
 					continue
 
 				if f[1]['type'] == 'dir':
-					directory_in_tree = pjoin(current_directory, f[0])
-					queue.append(directory_in_tree)
-					yield directory_in_tree
+					queue.append(pjoin(current_directory, f[0]))
 
-	def recursively_copy_files_from_remote_directory(self, local_root_directory: str, remote_root_directory: str,
-													 overwrite_local_file: bool = False, verbose: bool = False,
-													 dry_run: bool = False, filetype_restrictions: list = []) -> None:
+			yield current_directory, filelist
+
+	def _collect_remote_copy_jobs(self, local_root_directory: str, remote_root_directory: str,
+								  overwrite_local_file: bool, verbose: bool, dry_run: bool,
+								  filetype_restrictions: tuple, resume_partial_files: bool = False) -> list:
 		"""
-		Recursively copy files from a remote directory to a local directory using FTP.
+		Walk a remote tree, create the matching local directories and list the files to download.
 
 		Parameters:
 			local_root_directory (str): The root directory for local copies. Will be created if it does not exist.
 			remote_root_directory (str): The root directory on the remote FTP server.
 			overwrite_local_file (bool): Whether to overwrite existing local files.
 			verbose (bool): Whether to print verbose output.
-			dry_run (bool): Whether to perform a dry run (no actual copying).
-			filetype_restrictions (list): List of allowed file extensions to copy.
+			dry_run (bool): Whether to perform a dry run (no directories created, no files listed).
+			filetype_restrictions (tuple): Allowed file extensions to copy, without the dot, so files without an extension are skipped. Empty copies all files.
+			resume_partial_files (bool): Whether to resume local files smaller than the remote file.
 
 		Returns:
-			None
+			list: (remote_file_path, local_file_path, size, offset) tuples, one per file to download.
 
 		"""
 
@@ -166,77 +777,208 @@ class FTPDataExchange:
 
 		local_root_directory = pjoin(local_root_directory, os.path.basename(remote_root_directory)) # update local root
 
-		for remote_directory_in_tree in self.walk_remote_tree(remote_root_directory = remote_root_directory):
+		allowed_filetypes = frozenset(filetype_restrictions) if filetype_restrictions else None
 
-			local_directory_copy = remote_directory_in_tree.replace(remote_root_directory, local_root_directory)
+		jobs = []
 
-			if not dry_run:
-				os.makedirs(local_directory_copy, exist_ok = True)
+		for remote_directory_in_tree, filelist in self.walk_remote_tree(remote_root_directory = remote_root_directory):
 
-			self.ftp.cwd(remote_directory_in_tree)
+			local_directory_copy = _rebase_path(remote_directory_in_tree, remote_root_directory, local_root_directory)
 
-			filelist = [i for i in self.ftp.mlsd()]
+			if not dry_run:
+				os.makedirs(local_directory_copy, exist_ok = True)
 
 			for f in filelist:
 				if f[0].startswith('.'):
 					continue
 
 				if f[1]['type'] == 'file':
+
+					if allowed_filetypes is not None and os.path.splitext(f[0])[1][1:] not in allowed_filetypes: # check file to copy is in allowed filetypes
+						continue
+
 					local_file_copy = pjoin(local_directory_copy, f[0])
 
-					if not overwrite_local_file and os.path.exists(local_file_copy): # check file overwrite is allowed
+					remote_file_size = int(f[1].get('size', 0))
+
+					try:
+						local_file_size = os.path.getsize(local_file_copy)
+					except OSError:
+						local_file_size = None
+
+					offset = 0
+
+					if resume_partial_files and local_file_size is not None and local_file_size < remote_file_size:
+						offset = local_file_size
+
+					elif not overwrite_local_file and local_file_size is not None: # check file overwrite is allowed
 						continue
 
-					if local_file_copy.split('.')[-1] in filetype_restrictions or len(filetype_restrictions) == 0: # check file to copy is in allowed filetypes
+					if verbose:
+						print(f'Copying file to: {local_file_copy}')
+
+					if not dry_run:
+						# a preallocated file would look complete if interrupted, so never preallocate resumable downloads
+						preallocate_size = 0 if resume_partial_files else remote_file_size
+						jobs.append((pjoin(remote_directory_in_tree, f[0]), local_file_copy, preallocate_size, offset))
+
+		return jobs
+
+	def recursively_copy_files_from_remote_directory(self, local_root_directory: str, remote_root_directory: str,
+													 overwrite_local_file: bool = False, verbose: bool = False,
+													 dry_run: bool = False, filetype_restrictions: tuple = (),
+													 concurrency: int = 1, resume_partial_files: bool = False) -> None:
+		"""
+		Recursively copy files from a remote directory to a local directory using FTP.
+
+		The remote tree is walked on the main connection to collect the files to copy, which are then
+		transferred by up to `concurrency` worker connections.
+
+		With resume_partial_files, an existing local file smaller than the remote file is treated as an
+		interrupted download and completed from its current size, regardless of overwrite_local_file.
+
+		Parameters:
+			local_root_directory (str): The root directory for local copies. Will be created if it does not exist.
+			remote_root_directory (str): The root directory on the remote FTP server.
+			overwrite_local_file (bool): Whether to overwrite existing local files.
+			verbose (bool): Whether to print verbose output.
+			dry_run (bool): Whether to perform a dry run (no actual copying).
+			filetype_restrictions (tuple): Allowed file extensions to copy, without the dot, so files without an extension are skipped. Empty copies all files.
+			concurrency (int): The number of files to transfer in parallel, each over its own connection.
+			resume_partial_files (bool): Whether to resume local files smaller than the remote file.
+
+		Returns:
+			None
+
+		"""
+
+		jobs = self._collect_remote_copy_jobs(local_root_directory, remote_root_directory, overwrite_local_file,
+											  verbose, dry_run, filetype_restrictions, resume_partial_files)
+
+		self._run_transfers(self._download_file, jobs, concurrency = concurrency)
+
+	async def async_recursively_copy_files_from_remote_directory(self, local_root_directory: str, remote_root_directory: str,
+																 overwrite_local_file: bool = False, verbose: bool = False,
+																 dry_run: bool = False, filetype_restrictions: tuple = (),
+																 concurrency: int = 4) -> None:
+		"""
+		Recursively copy files from a remote directory to a local directory using asyncio and aioftp.
+
+		The remote tree is walked on the main connection as in recursively_copy_files_from_remote_directory.
+		The files are then downloaded by `concurrency` coroutines, each with its own aioftp client, so
+		transfers overlap without a thread per connection. Requires the optional aioftp dependency
+		(pip install FTPDataExchange[async]); FTPS is not supported by this method.
+
+		Parameters:
+			local_root_directory (str): The root directory for local copies. Will be created if it does not exist.
+			remote_root_directory (str): The root directory on the remote FTP server.
+			overwrite_local_file (bool): Whether to overwrite existing local files.
+			verbose (bool): Whether to print verbose output.
+			dry_run (bool): Whether to perform a dry run (no actual copying).
+			filetype_restrictions (tuple): Allowed file extensions to copy, without the dot, so files without an extension are skipped. Empty copies all files.
+			concurrency (int): The number of files to transfer in parallel, each over its own connection.
+
+		Returns:
+			None
+
+		Raises:
+			ImportError: If aioftp is not installed.
+			ValueError: If the instance was created with use_tls.
+
+		"""
+
+		try:
+			import aioftp
+		except ImportError:
+			raise ImportError('async transfers require aioftp: pip install FTPDataExchange[async]')
+
+		if self.use_tls:
+			raise ValueError('async transfers do not support FTPS, create the instance without use_tls')
+
+		jobs = self._collect_remote_copy_jobs(local_root_directory, remote_root_directory, overwrite_local_file,
+											  verbose, dry_run, filetype_restrictions)
+
+		if not jobs:
+			return
+
+		pending = asyncio.Queue()
+		for job in jobs:
+			pending.put_nowait(job)
+
+		async def worker():
+			# each coroutine owns its client; commands from different tasks must not interleave on one connection
+			async with aioftp.Client.context(self.host, user = self.user, password = self.password) as client:
+				while not pending.empty():
+					remote_file_path, local_file_path, _, _ = pending.get_nowait()
+					await client.download(remote_file_path, local_file_path, write_into = True, block_size = TRANSFER_BLOCKSIZE)
 
-						if verbose:
-							print(f'Copying file to: {local_file_copy}')
+		workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, self.max_connections, len(jobs)))]
 
-						if not dry_run:
-							self.ftp.retrbinary('RETR ' + f[0], open(local_file_copy, 'wb').write)
+		try:
+			await asyncio.gather(*workers)
+		except BaseException:
+			# stop the other workers as soon as one fails, and retrieve their errors so none go unreported
+			for task in workers:
+				task.cancel()
+			await asyncio.gather(*workers, return_exceptions = True)
+			raise
 
 	def walk_local_tree(self, local_root_directory: str):
 		"""
-		Traverse the local directory tree using breadth-first search and yield each directory path.
+		Traverse the local directory tree using breadth-first search and yield each directory path with its entries.
+
+		Each directory is scanned once with os.scandir; the entries are yielded so callers can pick out
+		files without listing or stat-ing the directory again. Symlinked directories are not followed.
 
 		Parameters:
 			local_root_directory (str): The root directory on the local system.
 
 		Yields:
-			str: The path of each directory in the local tree.
+			tuple: The path of each directory in the local tree and its list of os.DirEntry entries.
 
 		"""
-		
-		yield local_root_directory
 
-		queue = [local_root_directory]
+		queue = deque([local_root_directory])
 
 		while queue:
 
-			current_directory = queue.pop(0)	
+			current_directory = queue.popleft()
 
-			os.chdir(current_directory)
+			with os.scandir(current_directory) as scanned:
+				entries = list(scanned)
 
-			directory_list = [os.path.basename(i) for i in os.listdir(current_directory) if os.path.isdir(i)]
+			for entry in entries:
+				if entry.is_dir(follow_symlinks = False):
+					queue.append(entry.path)
 
-			for d in directory_list:
-				directory_in_tree = pjoin(current_directory, d)
-				queue.append(directory_in_tree)
-				yield directory_in_tree
+			yield current_directory, entries
 
 	def recursively_copy_files_from_local_directory(self, remote_root_directory: str, local_root_directory: str,
 													 overwrite_remote_file: bool = False, verbose: bool = False,
-													 dry_run: bool = False, filetype_restrictions: list = []) -> None:
+													 dry_run: bool = False, filetype_restrictions: tuple = (),
+													 concurrency: int = 1, sync_mode: bool = False,
+													 resume_partial_files: bool = False) -> None:
 		"""
 		Recursively copy files from a local directory to a remote directory using FTP.
 
+		Remote directories are created on the main connection while the local tree is walked; the files
+		are then transferred by up to `concurrency` worker connections.
+
+		With sync_mode, a file is uploaded only when the remote copy is missing, differs in size, or is
+		older than the local file, regardless of overwrite_remote_file. With resume_partial_files, an
+		existing remote file smaller than the local file is treated as an interrupted upload and completed
+		from its current size.
+
 		Parameters:
 			remote_root_directory (str): The root directory on the remote FTP server.
 			local_root_directory (str): The root directory for local copies.
 			overwrite_remote_file (bool): Whether to overwrite existing remote files.
 			verbose (bool): Whether to print verbose output.
 			dry_run (bool): Whether to perform a dry run (no actual copying).
-			filetype_restrictions (list): List of allowed file extensions to copy.
+			filetype_restrictions (tuple): Allowed file extensions to copy, without the dot, so files without an extension are skipped. Empty copies all files.
+			concurrency (int): The number of files to transfer in parallel, each over its own connection.
+			sync_mode (bool): Whether to skip files whose remote copy is already up to date.
+			resume_partial_files (bool): Whether to resume remote files smaller than the local file.
 
 		Returns:
 			None
@@ -248,43 +990,70 @@ class FTPDataExchange:
 
 		remote_root_directory = pjoin(remote_root_directory, os.path.basename(local_root_directory)) # update remote root
 
-		for local_directory_in_tree in self.walk_local_tree(local_root_directory = local_root_directory):
+		allowed_filetypes = frozenset(filetype_restrictions) if filetype_restrictions else None
 
-			remote_directory_copy = local_directory_in_tree.replace(local_root_directory, remote_root_directory)
+		jobs = []
 
-			try:
-				self.ftp.cwd(remote_directory_copy)
+		# Remote directories known to exist, filled from listings that are needed for the files anyway,
+		# so existence is never probed with a separate CWD.
+		remote_parent_directory = os.path.dirname(remote_root_directory)
+		remote_directories = {pjoin(remote_parent_directory, ri[0]) for ri in self.ftp.mlsd(remote_parent_directory) if ri[1]['type'] == 'dir'}
 
-			except error_perm:
+		for local_directory_in_tree, entries in self.walk_local_tree(local_root_directory = local_root_directory):
 
-				if not dry_run:
-					if verbose:
-						print(f'Making dir: {remote_directory_copy}')
-					self.ftp.mkd(remote_directory_copy)
-				else:
-					raise NotImplementedError('Directory doesnt exist and this is a dry run')
+			remote_directory_copy = _rebase_path(local_directory_in_tree, local_root_directory, remote_root_directory)
+
+			if remote_directory_copy in remote_directories:
+
+				remote_listing = [ri for ri in self.ftp.mlsd(remote_directory_copy)]
+
+				remote_directories.update(pjoin(remote_directory_copy, ri[0]) for ri in remote_listing if ri[1]['type'] == 'dir')
+
+				remote_files = {ri[0]: ri[1] for ri in remote_listing if ri[1]['type'] == 'file'}
+
+			elif not dry_run:
+
+				if verbose:
+					print(f'Making dir: {remote_directory_copy}')
+				self.ftp.mkd(remote_directory_copy)
+
+				remote_files = {}
+
+			else:
+				raise NotImplementedError('Directory doesnt exist and this is a dry run')
+
+			filelist = [entry for entry in entries if entry.is_file()]
+
+			for entry in filelist:
+
+				f = entry.name
+
+				if allowed_filetypes is not None and os.path.splitext(f)[1][1:] not in allowed_filetypes: # check file to copy is in allowed filetypes
 					continue
-			
-			filelist = [i for i in os.listdir(local_directory_in_tree) if os.path.isfile(pjoin(local_directory_in_tree, i))]
 
-			remote_filelist = [ri[0] for ri in self.ftp.mlsd() if ri[1]['type'] == 'file']
+				remote_facts = remote_files.get(f)
 
-			for f in filelist:
+				offset = 0
+
+				if resume_partial_files and remote_facts and 'size' in remote_facts and int(remote_facts['size']) < entry.stat().st_size:
+					offset = int(remote_facts['size'])
 
-				if f in remote_filelist:
+				elif sync_mode:
+					if self._remote_file_is_current(entry, remote_facts):
+						continue
 
-					if f.split('.')[-1] in filetype_restrictions or len(filetype_restrictions) == 0:
+				elif not overwrite_remote_file and f in remote_files: # check file overwrite is allowed
+					continue
 
-						if overwrite_remote_file:
+				if verbose:
+					print(f'Copying file to: {pjoin(remote_directory_copy, f)}')
 
-							if verbose:
-								print(f'Copying file to: {pjoin(remote_directory_copy, f)}')
+				if dry_run:
+					continue
 
-							if dry_run:
-								continue
+				jobs.append((entry.path, pjoin(remote_directory_copy, f), offset))
 
-							with open(pjoin(local_directory_in_tree, f), 'rb') as out_file:
-								self.ftp.storbinary('STOR ' + f, out_file)
+		self._run_transfers(self._upload_file, jobs, concurrency = concurrency)
 
 	def copy_file_to_remote_directory(self, local_file_path: str, target_remote_directory: str) -> None:
 		"""
@@ -300,16 +1069,102 @@ class FTPDataExchange:
 		"""
 		print(f'Copying {local_file_path} to {target_remote_directory}')
 
-		file_name = os.path.basename(local_file_path)
+		remote_file_path = pjoin(target_remote_directory, os.path.basename(local_file_path))
+
 		try:
-			self.ftp.cwd(target_remote_directory)
+			self._upload_file(self.ftp, local_file_path, remote_file_path)
 		except Exception as e:
-			print(f'Error: Unable to change to target remote directory. {str(e)}')
-			return
+			print(f'Error: Unable to copy the file. {str(e)}')
+
+	def _download_range(self, remote_file_path: str, fd: int, start: int, end: int) -> None:
+		"""
+		Download bytes [start, end) of a remote file into an open local file on a worker connection.
+
+		Parameters:
+			remote_file_path (str): The absolute path of the remote file.
+			fd (int): The file descriptor of the local file.
+			start (int): The first byte to download.
+			end (int): The byte to stop at; the data connection is closed there instead of reading to EOF.
+
+		Returns:
+			None
+
+		"""
+
+		ftp = self._open_worker_connection()
+
+		try:
+			ftp.voidcmd('TYPE I')
+
+			with ftp.transfercmd('RETR ' + remote_file_path, rest = start) as conn:
+				offset = start
+				while offset < end:
+					chunk = conn.recv(min(TRANSFER_BLOCKSIZE, end - offset))
+					if not chunk:
+						raise EOFError(f'{remote_file_path} ended at byte {offset}, expected {end}')
+					os.pwrite(fd, chunk, offset)
+					offset += len(chunk)
+
+			try:
+				ftp.voidresp()
+			except all_errors: # the reply to a transfer cut short varies by server, and the connection is discarded
+				pass
+
+		finally:
+			# servers differ in what they send after a data connection is cut short, so never pool it
+			self._release_worker_connection(ftp, reusable = False)
+
+	def copy_file_to_local_directory(self, remote_file_path: str, target_local_directory: str, concurrency: int = 1) -> None:
+		"""
+		Copy a file from a remote directory to a local directory using FTP.
+
+		With `concurrency` > 1, files of at least PARALLEL_DOWNLOAD_THRESHOLD bytes are split into
+		byte ranges that are downloaded in parallel, each over its own connection using REST. If the
+		server does not report the size, the file is downloaded as a single stream. A failed parallel
+		download removes the local file.
+
+		Parameters:
+			remote_file_path (str): The absolute path of the remote file to copy.
+			target_local_directory (str): The target local directory.
+			concurrency (int): The number of byte ranges to download in parallel.
+
+		Returns:
+			None
+
+		"""
+		print(f'Copying {remote_file_path} to {target_local_directory}')
+
+		local_file_path = pjoin(target_local_directory, os.path.basename(remote_file_path))
+		try:
+			self.ftp.voidcmd('TYPE I')
+			size = self.ftp.size(remote_file_path) or 0
+		except all_errors: # SIZE is optional, fall back to a single stream
+			size = 0
+
+		workers = min(concurrency, self.max_connections)
 
 		try:
-			with open(local_file_path, 'rb') as out_file:
-				self.ftp.storbinary('STOR ' + file_name, out_file)
+			if workers <= 1 or size < PARALLEL_DOWNLOAD_THRESHOLD or not hasattr(os, 'pwrite'):
+				self._download_file(self.ftp, remote_file_path, local_file_path, size)
+				return
+
+			range_size = -(-size // workers)
+
+			try:
+				with open(local_file_path, 'wb') as in_file:
+					if hasattr(os, 'posix_fallocate'):
+						try:
+							os.posix_fallocate(in_file.fileno(), 0, size)
+						except OSError: # not supported by every filesystem
+							pass
+
+					with ThreadPoolExecutor(max_workers = workers) as executor:
+						self._wait_for_transfers([executor.submit(self._download_range, remote_file_path, in_file.fileno(), start, min(start + range_size, size))
+												  for start in range(0, size, range_size)])
+			except Exception:
+				# ranges finish out of order, so a partial file has zero-filled holes and cannot be resumed
+				os.remove(local_file_path)
+				raise
+
 		except Exception as e:
 			print(f'Error: Unable to copy the file. {str(e)}')
-
@@ -12,6 +12,8 @@ with open('HISTORY.rst') as history_file:
 
 requirements = [ ]
 
+extras_requirements = {'async': ['aioftp>=0.21', ], }
+
 test_requirements = ['pytest>=3', ]
 
 setup(
@@ -30,6 +32,7 @@ setup(
     ],
     description="Copy files to and from a remote server using FTP.",
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="MIT license",
     long_description=readme + '\n\n' + history,
     include_package_data=True,
@@ -2,26 +2,522 @@
 
 """Tests for `FTPDataExchange` package."""
 
+import asyncio
+import os
+import ssl
+import threading
+import time
+
 import pytest
-from unittest.mock import patch, Mock
+from ftplib import error_perm, error_temp
+from unittest.mock import patch, MagicMock, Mock
 
 
-from FTPDataExchange import FTPDataExchange
+from FTPDataExchange.FTPDataExchange import FTPDataExchange, _ControlKeepalive, _parse_mdtm, _rebase_path, _retrbinary
 
 
 @pytest.fixture
 def ftp_data_exchange():
 	# Create an instance of FTPDataExchange with mock FTP connection
-	with patch('ftplib.FTP') as MockFTP:
+	with patch('FTPDataExchange.FTPDataExchange.FTP'):
 		instance = FTPDataExchange('ftp_host', 'ftp_user', 'ftp_passwd')
-		instance.ftp = MockFTP.return_value
 		yield instance
 
 def test_connect_to_remote_success(ftp_data_exchange):
 	# Mock a successful connection
-	with patch.object(ftp_data_exchange.ftp, 'login'):
-		ftp_data_exchange.connect_to_remote()
+	ftp_data_exchange.connect_to_remote()
 
-	assert ftp_data_exchange.ftp.login.called
+	ftp_data_exchange.ftp.login.assert_called_with(user = 'ftp_user', passwd = 'ftp_passwd')
 	assert ftp_data_exchange.ftp.set_pasv.called
-	assert ftp_data_exchange.ftp.set_pasv.called == 'woo'
\ No newline at end of file
+
+def test_list_files_remote(ftp_data_exchange):
+	ftp_data_exchange.ftp.mlsd.return_value = iter([
+		('.', {'type': 'cdir'}),
+		('..', {'type': 'pdir'}),
+		('data', {'type': 'dir'}),
+		('file name.txt', {'type': 'file'}),
+	])
+
+	assert ftp_data_exchange.list_files_remote('/remote') == ['data', 'file name.txt']
+	ftp_data_exchange.ftp.mlsd.assert_called_with('/remote')
+
+def test_worker_connections_are_reused(ftp_data_exchange):
+	with patch('FTPDataExchange.FTPDataExchange.FTP', side_effect = lambda host: Mock()):
+		worker = ftp_data_exchange._open_worker_connection()
+		ftp_data_exchange._release_worker_connection(worker)
+
+		assert ftp_data_exchange._open_worker_connection() is worker
+		assert ftp_data_exchange._open_worker_connection() is not worker
+
+	worker.voidcmd.assert_called_with('NOOP')
+
+def test_failed_transfer_connection_is_not_reused(ftp_data_exchange):
+	used = []
+	used_lock = threading.Lock()
+
+	def transfer(ftp, name):
+		with used_lock:
+			used.append((ftp, name))
+		if name == 'bad':
+			raise OSError('write failed')
+
+	jobs = [('a',), ('bad',), ('b',), ('c',), ('d',), ('e',)]
+
+	with patch('FTPDataExchange.FTPDataExchange.FTP', side_effect = lambda host: Mock()):
+		with pytest.raises(OSError):
+			ftp_data_exchange._run_transfers(transfer, jobs, concurrency = 2)
+
+	failed_index = [name for _, name in used].index('bad')
+	failed_ftp = used[failed_index][0]
+
+	assert failed_ftp not in [ftp for ftp, _ in used[failed_index + 1:]]
+	assert failed_ftp.quit.called
+	assert failed_ftp not in [ftp for ftp, _ in ftp_data_exchange._idle_connections.queue]
+
+def test_ftps_uses_given_ssl_context():
+	context = ssl.create_default_context()
+
+	with patch('FTPDataExchange.FTPDataExchange._SessionReusingFTP_TLS') as MockFTP_TLS:
+		FTPDataExchange('ftp_host', 'ftp_user', 'ftp_passwd', use_tls = True, ssl_context = context)
+
+	assert MockFTP_TLS.call_args.kwargs['context'] is context
+
+def test_rebase_path_only_replaces_the_root():
+	assert _rebase_path('/data/data/foo', '/data', '/local/data') == '/local/data/data/foo'
+
+def test_rebase_path_of_the_root_is_the_new_root():
+	assert _rebase_path('/data', '/data', '/local/data') == '/local/data'
+
+def test_copy_file_to_remote_directory_stores_by_full_path(ftp_data_exchange, tmp_path):
+	local_file = tmp_path / 'file.txt'
+	local_file.write_bytes(b'data')
+
+	ftp_data_exchange.ftp.cwd('/somewhere/else')
+	ftp_data_exchange.copy_file_to_remote_directory(str(local_file), '/remote')
+
+	ftp_data_exchange.ftp.transfercmd.assert_called_with('STOR /remote/file.txt', None)
+
+def test_parse_mdtm_fractional_seconds():
+	assert _parse_mdtm('20231025120000') == 1698235200.0
+	assert _parse_mdtm('20231025120000.250') == 1698235200.25
+
+def test_remote_file_is_current_truncates_local_mtime():
+	# local mtime 12:00:00.700 against a whole-second remote time of 12:00:00
+	local_entry = Mock()
+	local_entry.stat.return_value = Mock(st_size = 4, st_mtime = 1698235200.7)
+
+	assert FTPDataExchange._remote_file_is_current(local_entry, {'size': '4', 'modify': '20231025120000'})
+	assert not FTPDataExchange._remote_file_is_current(local_entry, {'size': '4', 'modify': '20231025115959'})
+	assert not FTPDataExchange._remote_file_is_current(local_entry, {'size': '5', 'modify': '20231025120000'})
+
+def test_remote_file_is_current_without_facts():
+	local_entry = Mock()
+	local_entry.stat.return_value = Mock(st_size = 4, st_mtime = 1698235200.0)
+
+	assert not FTPDataExchange._remote_file_is_current(local_entry, None)
+	assert not FTPDataExchange._remote_file_is_current(local_entry, {'type': 'file'})
+	assert not FTPDataExchange._remote_file_is_current(local_entry, {'type': 'file', 'size': '4'})
+
+def _mock_data_connection(ftp, *chunks):
+	# transfercmd() returns a context manager whose data connection yields chunks, then raises OSError
+	conn = MagicMock()
+	conn.recv.side_effect = list(chunks) + [OSError('connection reset')]
+	ftp.transfercmd.return_value.__enter__.return_value = conn
+	return conn
+
+def test_failed_download_is_truncated_to_bytes_written(tmp_path):
+	ftp = MagicMock()
+	_mock_data_connection(ftp, b'abc', b'defg')
+	local_file = tmp_path / 'file.bin'
+
+	with pytest.raises(OSError):
+		FTPDataExchange._download_file(ftp, '/remote/file.bin', str(local_file), size = 400000)
+
+	assert local_file.read_bytes() == b'abcdefg'
+
+def test_download_of_shrunk_file_is_truncated_to_bytes_received(tmp_path):
+	ftp = MagicMock()
+	ftp.transfercmd.return_value.__enter__.return_value.recv.side_effect = [b'yyyyyyyyyy', b'']
+	local_file = tmp_path / 'file.bin'
+
+	FTPDataExchange._download_file(ftp, '/remote/file.bin', str(local_file), size = 1000)
+
+	assert local_file.read_bytes() == b'yyyyyyyyyy'
+
+def test_failed_resumed_download_keeps_earlier_bytes(tmp_path):
+	ftp = MagicMock()
+	_mock_data_connection(ftp, b'def')
+	local_file = tmp_path / 'file.bin'
+	local_file.write_bytes(b'abc')
+
+	with pytest.raises(OSError):
+		FTPDataExchange._download_file(ftp, '/remote/file.bin', str(local_file), offset = 3)
+
+	assert local_file.read_bytes() == b'abcdef'
+	ftp.transfercmd.assert_called_with('RETR /remote/file.bin', 3)
+
+def test_resume_offsets_for_downloads(ftp_data_exchange, tmp_path):
+	ftp_data_exchange.ftp.mlsd.side_effect = lambda *args, **kwargs: iter([
+		('partial.bin', {'type': 'file', 'size': '10'}),
+		('complete.bin', {'type': 'file', 'size': '10'}),
+		('new.bin', {'type': 'file', 'size': '10'}),
+	])
+	(tmp_path / 'data').mkdir()
+	(tmp_path / 'data' / 'partial.bin').write_bytes(b'x' * 4)
+	(tmp_path / 'data' / 'complete.bin').write_bytes(b'x' * 10)
+
+	jobs = ftp_data_exchange._collect_remote_copy_jobs(str(tmp_path), '/data', False, False, False, (), resume_partial_files = True)
+
+	assert sorted((os.path.basename(local), size, offset) for _, local, size, offset in jobs) == [('new.bin', 0, 0), ('partial.bin', 0, 4)]
+
+	jobs = ftp_data_exchange._collect_remote_copy_jobs(str(tmp_path), '/data', False, False, False, ())
+
+	assert [(os.path.basename(local), size, offset) for _, local, size, offset in jobs] == [('new.bin', 10, 0)]
+
+def test_filetype_restrictions_skip_files_without_extension_on_download(ftp_data_exchange, tmp_path):
+	ftp_data_exchange.ftp.mlsd.side_effect = lambda *args, **kwargs: iter([
+		('a.txt', {'type': 'file', 'size': '1'}),
+		('b.csv', {'type': 'file', 'size': '1'}),
+		('README', {'type': 'file', 'size': '1'}),
+		('txt', {'type': 'file', 'size': '1'}),
+		('archive.tar.txt', {'type': 'file', 'size': '1'}),
+	])
+	(tmp_path / 'data').mkdir()
+	(tmp_path / 'data' / 'a.txt').write_bytes(b'x')
+
+	jobs = ftp_data_exchange._collect_remote_copy_jobs(str(tmp_path), '/data', False, False, False, ('txt',))
+
+	assert sorted(os.path.basename(local) for _, local, _, _ in jobs) == ['archive.tar.txt']
+
+	jobs = ftp_data_exchange._collect_remote_copy_jobs(str(tmp_path), '/data', True, False, False, ('txt',))
+
+	assert sorted(os.path.basename(local) for _, local, _, _ in jobs) == ['a.txt', 'archive.tar.txt']
+
+def test_filetype_restrictions_skip_files_without_extension_on_upload(ftp_data_exchange, tmp_path):
+	listings = {
+		'/up': [('data', {'type': 'dir'})],
+		'/up/data': [],
+	}
+	ftp_data_exchange.ftp.mlsd.side_effect = lambda path, *args, **kwargs: iter(listings[path])
+	(tmp_path / 'data').mkdir()
+	for name in ('a.txt', 'b.csv', 'README', 'txt', 'archive.tar.txt'):
+		(tmp_path / 'data' / name).write_bytes(b'x')
+
+	with patch.object(ftp_data_exchange, '_run_transfers') as run_transfers:
+		ftp_data_exchange.recursively_copy_files_from_local_directory('/up', str(tmp_path / 'data'), filetype_restrictions = ('txt',))
+
+	assert sorted(remote for _, remote, _ in run_transfers.call_args.args[1]) == ['/up/data/a.txt', '/up/data/archive.tar.txt']
+
+def test_resume_offsets_for_uploads(ftp_data_exchange, tmp_path):
+	listings = {
+		'/up': [('data', {'type': 'dir'})],
+		'/up/data': [('partial.bin', {'type': 'file', 'size': '4'}), ('complete.bin', {'type': 'file', 'size': '10'})],
+	}
+	ftp_data_exchange.ftp.mlsd.side_effect = lambda path, *args, **kwargs: iter(listings[path])
+	(tmp_path / 'data').mkdir()
+	for name in ('partial.bin', 'complete.bin', 'new.bin'):
+		(tmp_path / 'data' / name).write_bytes(b'x' * 10)
+
+	with patch.object(ftp_data_exchange, '_run_transfers') as run_transfers:
+		ftp_data_exchange.recursively_copy_files_from_local_directory('/up', str(tmp_path / 'data'), resume_partial_files = True)
+
+	jobs = run_transfers.call_args.args[1]
+	assert sorted((remote, offset) for _, remote, offset in jobs) == [('/up/data/new.bin', 0), ('/up/data/partial.bin', 4)]
+
+def test_upload_creates_missing_remote_directories(ftp_data_exchange, tmp_path):
+	ftp_data_exchange.ftp.mlsd.side_effect = lambda path, *args, **kwargs: iter({'/up': []}[path])
+	(tmp_path / 'data' / 'sub' / 'deeper').mkdir(parents = True)
+	(tmp_path / 'data' / 'sub' / 'deeper' / 'file.txt').write_bytes(b'x')
+
+	with patch.object(ftp_data_exchange, '_run_transfers') as run_transfers:
+		ftp_data_exchange.recursively_copy_files_from_local_directory('/up', str(tmp_path / 'data'))
+
+	assert [c.args[0] for c in ftp_data_exchange.ftp.mkd.call_args_list] == ['/up/data', '/up/data/sub', '/up/data/sub/deeper']
+	assert [c.args[0] for c in ftp_data_exchange.ftp.mlsd.call_args_list] == ['/up']
+	assert run_transfers.call_args.args[1] == [(str(tmp_path / 'data' / 'sub' / 'deeper' / 'file.txt'), '/up/data/sub/deeper/file.txt', 0)]
+
+def test_upload_creates_only_missing_nested_directories(ftp_data_exchange, tmp_path):
+	listings = {
+		'/up': [('data', {'type': 'dir'})],
+		'/up/data': [('sub', {'type': 'dir'})],
+		'/up/data/sub': [],
+	}
+	ftp_data_exchange.ftp.mlsd.side_effect = lambda path, *args, **kwargs: iter(listings[path])
+	(tmp_path / 'data' / 'sub' / 'deeper' / 'deepest').mkdir(parents = True)
+
+	with patch.object(ftp_data_exchange, '_run_transfers'):
+		ftp_data_exchange.recursively_copy_files_from_local_directory('/up', str(tmp_path / 'data'))
+
+	assert [c.args[0] for c in ftp_data_exchange.ftp.mkd.call_args_list] == ['/up/data/sub/deeper', '/up/data/sub/deeper/deepest']
+	assert [c.args[0] for c in ftp_data_exchange.ftp.mlsd.call_args_list] == ['/up', '/up/data', '/up/data/sub']
+
+def test_resumed_upload_falls_back_to_appe(tmp_path):
+	conn = MagicMock()
+
+	def transfercmd(cmd, rest = None):
+		if cmd.startswith('STOR'):
+			raise error_perm('502 REST not implemented')
+		transfer = MagicMock()
+		transfer.__enter__.return_value = conn
+		return transfer
+
+	ftp = MagicMock()
+	ftp.transfercmd.side_effect = transfercmd
+	local_file = tmp_path / 'file.bin'
+	local_file.write_bytes(b'abcdef')
+
+	FTPDataExchange._upload_file(ftp, str(local_file), '/remote/file.bin', offset = 4)
+
+	assert ftp.transfercmd.call_args_list[0].args == ('STOR /remote/file.bin', 4)
+	assert ftp.transfercmd.call_args_list[1].args == ('APPE /remote/file.bin', None)
+	conn.sendall.assert_called_once_with(b'ef')
+
+def test_resumed_download_restarts_without_rest(tmp_path):
+	conn = MagicMock()
+	conn.recv.side_effect = [b'abcdef', b'']
+
+	def transfercmd(cmd, rest = None):
+		if rest:
+			raise error_perm('502 REST not implemented')
+		transfer = MagicMock()
+		transfer.__enter__.return_value = conn
+		return transfer
+
+	ftp = MagicMock()
+	ftp.transfercmd.side_effect = transfercmd
+	local_file = tmp_path / 'file.bin'
+	local_file.write_bytes(b'xyz')
+
+	FTPDataExchange._download_file(ftp, '/remote/file.bin', str(local_file), offset = 3)
+
+	assert ftp.transfercmd.call_args_list[0].args == ('RETR /remote/file.bin', 3)
+	assert ftp.transfercmd.call_args_list[1].args == ('RETR /remote/file.bin', None)
+	assert local_file.read_bytes() == b'abcdef'
+
+def test_resumed_download_failing_after_data_is_not_restarted(tmp_path):
+	conn = MagicMock()
+	conn.recv.side_effect = [b'def', b'']
+	ftp = MagicMock()
+	ftp.transfercmd.return_value.__enter__.return_value = conn
+	ftp.voidresp.side_effect = error_perm('550 Read error')
+	local_file = tmp_path / 'file.bin'
+	local_file.write_bytes(b'abc')
+
+	with pytest.raises(error_perm):
+		FTPDataExchange._download_file(ftp, '/remote/file.bin', str(local_file), offset = 3)
+
+	assert ftp.transfercmd.call_count == 1
+	assert local_file.read_bytes() == b'abcdef'
+
+def test_list_files_remote_keeps_facts_for_sync(ftp_data_exchange, tmp_path):
+	# like a real server, requesting facts sends OPTS MLST, which sticks to the session
+	session = {'facts': None}
+	listings = {
+		'/up': [('data', {'type': 'dir'})],
+		'/up/data': [('a.csv', {'type': 'file', 'size': '4', 'modify': '20991231000000'})],
+	}
+
+	def mlsd(path = '', facts = []):
+		if facts:
+			session['facts'] = facts
+		for name, entry_facts in listings[path]:
+			yield name, {key: value for key, value in entry_facts.items() if session['facts'] is None or key in session['facts']}
+
+	ftp_data_exchange.ftp.mlsd.side_effect = mlsd
+	(tmp_path / 'data').mkdir()
+	(tmp_path / 'data' / 'a.csv').write_bytes(b'abcd')
+
+	assert ftp_data_exchange.list_files_remote('/up/data') == ['a.csv']
+
+	with patch.object(ftp_data_exchange, '_run_transfers') as run_transfers:
+		ftp_data_exchange.recursively_copy_files_from_local_directory('/up', str(tmp_path / 'data'), sync_mode = True)
+
+	assert run_transfers.call_args.args[1] == []
+
+def test_download_range_accepts_any_reply_after_early_close(ftp_data_exchange, tmp_path):
+	worker = MagicMock()
+	worker.transfercmd.return_value.__enter__.return_value.recv.side_effect = [b'cdef']
+	worker.voidresp.side_effect = error_perm('550 Transfer aborted')
+	local_file = tmp_path / 'file.bin'
+	local_file.write_bytes(b'\0' * 8)
+
+	with patch.object(ftp_data_exchange, '_open_worker_connection', return_value = worker), \
+		 patch.object(ftp_data_exchange, '_release_worker_connection') as release:
+		with open(local_file, 'r+b') as in_file:
+			ftp_data_exchange._download_range('/remote/file.bin', in_file.fileno(), 2, 6)
+
+	assert local_file.read_bytes() == b'\0\0cdef\0\0'
+	release.assert_called_once_with(worker, reusable = False)
+
+def test_failed_parallel_download_removes_file(ftp_data_exchange, tmp_path):
+	ftp_data_exchange.ftp.size.return_value = 8
+
+	def download_range(remote_file_path, fd, start, end):
+		if start:
+			raise OSError('connection reset')
+		os.pwrite(fd, b'abcd', start)
+
+	with patch('FTPDataExchange.FTPDataExchange.PARALLEL_DOWNLOAD_THRESHOLD', 1):
+		with patch.object(ftp_data_exchange, '_download_range', side_effect = download_range):
+			ftp_data_exchange.copy_file_to_local_directory('/remote/file.bin', str(tmp_path), concurrency = 2)
+
+	assert not (tmp_path / 'file.bin').exists()
+
+def test_download_without_size_falls_back_to_single_stream(ftp_data_exchange, tmp_path):
+	ftp_data_exchange.ftp.size.side_effect = error_perm('502 SIZE not implemented')
+
+	with patch.object(FTPDataExchange, '_download_file') as download_file:
+		ftp_data_exchange.copy_file_to_local_directory('/remote/file.bin', str(tmp_path), concurrency = 4)
+
+	download_file.assert_called_once_with(ftp_data_exchange.ftp, '/remote/file.bin', str(tmp_path / 'file.bin'), 0)
+
+def _finish_keepalive(*replies):
+	# a keepalive that sent one NOOP per reply after the first, answered in the given order
+	ftp = MagicMock()
+	ftp.getresp.side_effect = list(replies)
+	keepalive = _ControlKeepalive(ftp, interval = 3600)
+	keepalive.stop()
+	keepalive._sent = len(replies) - 1
+	return keepalive.finish
+
+@pytest.mark.parametrize('replies', [
+	('200 NOOP ok', '226 Transfer complete'),
+	('226 Transfer complete', '200 NOOP ok'),
+	(error_perm('500 NOOP not allowed during transfer'), '226 Transfer complete'),
+])
+def test_keepalive_finish_returns_transfer_reply(replies):
+	assert _finish_keepalive(*replies)() == '226 Transfer complete'
+
+def test_keepalive_finish_raises_failed_transfer_reply():
+	finish = _finish_keepalive('200 NOOP ok', error_temp('426 Connection closed'), '200 NOOP ok')
+
+	with pytest.raises(error_temp):
+		finish()
+
+def test_retrbinary_consumes_keepalive_replies():
+	ftp = MagicMock()
+	received = []
+
+	def recv(blocksize):
+		time.sleep(0.02)
+		return b'' if len(received) == 3 else b'x'
+
+	ftp.transfercmd.return_value.__enter__.return_value.recv.side_effect = recv
+	ftp.getresp.side_effect = lambda: '200 NOOP ok' if ftp.getresp.call_count > 1 else '226 Transfer complete'
+
+	with patch('FTPDataExchange.FTPDataExchange.KEEPALIVE_INTERVAL', 0.005):
+		assert _retrbinary(ftp, 'RETR /remote/file.bin', received.append) == '226 Transfer complete'
+
+	noops = [c for c in ftp.putcmd.call_args_list if c.args == ('NOOP',)]
+	assert noops
+	assert ftp.getresp.call_count == 1 + len(noops)
+	assert not ftp.voidresp.called
+
+def test_main_connection_is_kept_alive_while_waiting(ftp_data_exchange):
+	released = threading.Event()
+
+	def transfer(ftp, name):
+		released.wait(5)
+
+	def noop(cmd):
+		released.set()
+
+	ftp_data_exchange.ftp.voidcmd.side_effect = noop
+
+	with patch('FTPDataExchange.FTPDataExchange.KEEPALIVE_INTERVAL', 0.01), \
+		 patch('FTPDataExchange.FTPDataExchange.FTP', side_effect = lambda host: Mock()):
+		ftp_data_exchange._run_transfers(transfer, [('a',), ('b',)], concurrency = 2)
+
+	ftp_data_exchange.ftp.voidcmd.assert_called_with('NOOP')
+
+class _MockAsyncClients:
+	# stands in for aioftp.Client.context, recording which task used each client
+	def __init__(self, fail_on = None):
+		self.users = []
+		self.downloaded = []
+		self.cancelled = 0
+		self.fail_on = fail_on
+
+	def context(self, host, user = None, password = None):
+		clients = self
+		users = set()
+		self.users.append(users)
+
+		class Client:
+			async def download(self, remote_file_path, local_file_path, write_into = False, block_size = None):
+				users.add(asyncio.current_task())
+				try:
+					await asyncio.sleep(0.01 if remote_file_path != clients.fail_on else 0)
+				except asyncio.CancelledError:
+					clients.cancelled += 1
+					raise
+				if remote_file_path == clients.fail_on:
+					raise ConnectionResetError(remote_file_path)
+				clients.downloaded.append((remote_file_path, local_file_path))
+
+		class Context:
+			async def __aenter__(self):
+				return Client()
+
+			async def __aexit__(self, *exc_info):
+				return False
+
+		return Context()
+
+def _async_jobs(count):
+	return [(f'/remote/f{i}.bin', f'/local/f{i}.bin', 0, 0) for i in range(count)]
+
+def test_async_copy_fans_jobs_out_over_one_client_per_task(ftp_data_exchange):
+	aioftp = pytest.importorskip('aioftp')
+	clients = _MockAsyncClients()
+
+	with patch.object(aioftp.Client, 'context', clients.context), \
+		 patch.object(ftp_data_exchange, '_collect_remote_copy_jobs', return_value = _async_jobs(7)):
+		asyncio.run(ftp_data_exchange.async_recursively_copy_files_from_remote_directory('/local', '/remote', concurrency = 3))
+
+	assert sorted(clients.downloaded) == sorted((remote, local) for remote, local, _, _ in _async_jobs(7))
+	assert len(clients.users) == 3
+	assert all(len(users) == 1 for users in clients.users)
+	assert len(set().union(*clients.users)) == 3
+
+def test_async_copy_client_count_is_capped(ftp_data_exchange):
+	aioftp = pytest.importorskip('aioftp')
+	clients = _MockAsyncClients()
+	ftp_data_exchange.max_connections = 2
+
+	with patch.object(aioftp.Client, 'context', clients.context), \
+		 patch.object(ftp_data_exchange, '_collect_remote_copy_jobs', return_value = _async_jobs(5)):
+		asyncio.run(ftp_data_exchange.async_recursively_copy_files_from_remote_directory('/local', '/remote', concurrency = 8))
+
+	assert len(clients.users) == 2
+
+	clients = _MockAsyncClients()
+
+	with patch.object(aioftp.Client, 'context', clients.context), \
+		 patch.object(ftp_data_exchange, '_collect_remote_copy_jobs', return_value = _async_jobs(1)):
+		asyncio.run(ftp_data_exchange.async_recursively_copy_files_from_remote_directory('/local', '/remote', concurrency = 8))
+
+	assert len(clients.users) == 1
+
+def test_async_copy_cancels_other_workers_on_failure(ftp_data_exchange):
+	aioftp = pytest.importorskip('aioftp')
+	clients = _MockAsyncClients(fail_on = '/remote/f0.bin')
+
+	async def copy():
+		with pytest.raises(ConnectionResetError):
+			await ftp_data_exchange.async_recursively_copy_files_from_remote_directory('/local', '/remote', concurrency = 3)
+		# checked before asyncio.run cancels leftover tasks on shutdown
+		return clients.cancelled
+
+	with patch.object(aioftp.Client, 'context', clients.context), \
+		 patch.object(ftp_data_exchange, '_collect_remote_copy_jobs', return_value = _async_jobs(6)):
+		assert asyncio.run(copy()) == 2
+
+	assert clients.downloaded == []
+
+def test_async_copy_rejects_tls(ftp_data_exchange):
+	pytest.importorskip('aioftp')
+	ftp_data_exchange.use_tls = True
+
+	with pytest.raises(ValueError):
+		asyncio.run(ftp_data_exchange.async_recursively_copy_files_from_remote_directory('/local', '/remote'))